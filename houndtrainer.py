@@ -1,11 +1,17 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterator, Iterable
+import concurrent.futures
 import requests
 import argparse
 import logging
 import getpass
+import itertools
+import threading
+import zipfile
 import json
 import sys
 import csv
+import re
+import os
 
 _HAS_PANDAS_SUPPORT = False
 # Try importing pandas, handle error if missing
@@ -25,11 +31,33 @@ custom_nodes_path = f"/api/{api_version}/custom-nodes"
 # cypher endpoint
 saved_queries_path = f"/api/{api_version}/saved-queries"
 
+# validation patterns for model and cypher files
+# \Z instead of $ so a trailing newline is not accepted
+_KIND_NAME_PATTERN = r'^[A-Za-z][A-Za-z0-9_]*\Z'
+_ICON_NAME_PATTERN = r'^[a-z0-9]+(?:-[a-z0-9]+)*\Z'
+_COLOR_PATTERN = r'^#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})\Z'
+_KIND_NAME_RE = re.compile(_KIND_NAME_PATTERN)
+_ICON_NAME_RE = re.compile(_ICON_NAME_PATTERN)
+_COLOR_RE = re.compile(_COLOR_PATTERN)
+# the only icon type accepted by the custom-nodes endpoint
+_ICON_TYPE = "font-awesome"
+# icon index used when '--icons' is not provided
+_DEFAULT_ICON_INDEX = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "fontawesome-free-icons.txt")
+# {{column}} placeholders in cypher templates
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*([^{}]+?)\s*\}\}')
+# template columns available for each kind of a model JSON
+_MODEL_TEMPLATE_COLUMNS = ("Kind Name", "Icon Name", "Color")
+
 # module-level variable to store the JWT token, might refactor this
 _JWT_TOKEN: Optional[str] = None
 
-# Create a session for persistent connections
-session = requests.Session()
+# Create a session per thread for persistent connections, requests does not guarantee a Session is thread-safe
+_THREAD_LOCAL = threading.local()
+
+def get_session() -> requests.Session:
+    if not hasattr(_THREAD_LOCAL, "session"):
+        _THREAD_LOCAL.session = requests.Session()
+    return _THREAD_LOCAL.session
 
 def prompt_for_jwt():
     global _JWT_TOKEN
@@ -63,7 +91,7 @@ def handle_request(method: str, url: str, **kwargs):
             req_headers.update(kwargs['headers'])
             del kwargs['headers']
             
-        response = session.request(method, url, headers=req_headers, **kwargs)
+        response = get_session().request(method, url, headers=req_headers, **kwargs)
         response.raise_for_status()
 
         return True, response
@@ -90,6 +118,25 @@ def write_json_to_file(data: Dict[str, Any], file_path: str, indent: int = 4) ->
         print(f"An unexpected error occurred: {e}")
         return False
 
+def write_ndjson_to_file(items: List[Dict[str, Any]], file_path: str) -> bool:
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item) + "\n")
+        return True
+    except (TypeError, IOError) as e:
+        logging.error(f"Failed to write NDJSON to '{file_path}': {e}")
+        return False
+
+def read_batch_keys(values: Optional[List[str]], from_file: Optional[str] = None) -> List[str]:
+    keys = list(values or [])
+    if from_file:
+        # one kind name or id per line, blank lines and comments are ignored
+        with open(from_file, 'r', encoding='utf-8') as f:
+            keys.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    # drop duplicates but keep the requested order
+    return list(dict.fromkeys(keys))
+
 # model methods
 def pd_transform_csv_to_custom_types_json(csv_file_path: str) -> Dict[str, Any]:
     try:
@@ -152,7 +199,279 @@ def transform_csv_to_custom_types_json(csv_file_path: str) -> Dict[str, Any]:
     except Exception as e:
         logging.exception(f"An exception occurred: {e}")
         return {}
-    
+
+# validation methods
+def load_icon_index(icons_file: str) -> Optional[frozenset]:
+    names = set()
+    try:
+        with open(icons_file, 'r', encoding='utf-8') as f:
+            if icons_file.lower().endswith(".json"):
+                data = json.load(f)
+                if isinstance(data, dict):
+                    # font-awesome metadata (icons.json) is keyed by icon name, aliases are valid names too
+                    for name, meta in data.items():
+                        names.add(name)
+                        if isinstance(meta, dict):
+                            names.update(meta.get("aliases", {}).get("names", []))
+                elif isinstance(data, list):
+                    names.update(str(name) for name in data)
+            else:
+                # plain text, one icon name per line
+                names.update(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    except FileNotFoundError:
+        logging.error(f"Icon index file not found at path '{icons_file}'")
+        return None
+    except json.JSONDecodeError as e:
+        logging.error(f"Error decoding JSON in icon index file '{icons_file}': {e}")
+        return None
+    logging.info(f"Loaded {len(names)} icon names from '{icons_file}'.")
+    return frozenset(names)
+
+def validate_custom_type_row(kind_name: str, icon_type: str, icon_name: str, color: str, icon_index: Optional[frozenset], seen: set) -> List[str]:
+    errors = []
+    if not kind_name:
+        errors.append("missing 'Kind Name'")
+    elif not _KIND_NAME_RE.match(kind_name):
+        errors.append(f"illegal kind name {kind_name!r}")
+    elif kind_name in seen:
+        errors.append(f"duplicate kind name {kind_name!r}")
+    else:
+        seen.add(kind_name)
+    if icon_type != _ICON_TYPE:
+        errors.append(f"unsupported icon type {icon_type!r}, expected '{_ICON_TYPE}'")
+    if not icon_name:
+        errors.append("missing 'Icon Name'")
+    elif not _ICON_NAME_RE.match(icon_name):
+        errors.append(f"malformed icon name {icon_name!r}")
+    elif icon_index is not None and icon_name not in icon_index:
+        errors.append(f"unknown font-awesome icon name {icon_name!r}")
+    if not color:
+        errors.append("missing 'Color'")
+    elif not _COLOR_RE.match(color):
+        errors.append(f"invalid hex color {color!r}")
+    return errors
+
+def pd_invalid_values(values, pattern) -> set:
+    # icon names and colors repeat heavily, so match each distinct value once instead of every row
+    return {value for value in values.unique() if value and not pattern.match(value)}
+
+def pd_validate_custom_types_frame(df, icon_index: Optional[frozenset], locate: Callable[[int], str]) -> List[str]:
+    # every check is evaluated over the whole column, only the failing rows are formatted
+    # values are checked exactly as given, callers strip them where the upload would too
+    kinds = df['Kind Name']
+    icon_types = df['Icon Type']
+    icons = df['Icon Name']
+    colors = df['Color']
+    has_kind = kinds != ''
+    legal_kind = has_kind & kinds.str.match(_KIND_NAME_PATTERN)
+    has_icon = icons != ''
+    legal_icon = has_icon & ~icons.isin(pd_invalid_values(icons, _ICON_NAME_RE))
+    has_color = colors != ''
+    checks = [
+        (~has_kind, kinds, "missing 'Kind Name'"),
+        (has_kind & ~legal_kind, kinds, "illegal kind name {!r}"),
+        (legal_kind & kinds.duplicated(), kinds, "duplicate kind name {!r}"),
+        (icon_types != _ICON_TYPE, icon_types, f"unsupported icon type {{!r}}, expected '{_ICON_TYPE}'"),
+        (~has_icon, icons, "missing 'Icon Name'"),
+        (has_icon & ~legal_icon, icons, "malformed icon name {!r}"),
+        (colors.isin(pd_invalid_values(colors, _COLOR_RE)), colors, "invalid hex color {!r}"),
+        (~has_color, colors, "missing 'Color'"),
+    ]
+    if icon_index is not None:
+        checks.append((legal_icon & ~icons.isin(icon_index), icons, "unknown font-awesome icon name {!r}"))
+    failures: List[Tuple[int, int, str]] = []
+    for order, (mask, values, message) in enumerate(checks):
+        for position in mask.to_numpy().nonzero()[0]:
+            failures.append((position, order, f"{locate(position)}: {message.format(values.iat[position])}"))
+    # report in file order so errors for the same row stay together
+    failures.sort()
+    return [failure[2] for failure in failures]
+
+def read_csv_record_lines(csv_file_path: str) -> List[int]:
+    # line on which each data record ends, blank lines are skipped like DictReader and pandas do
+    with open(csv_file_path, mode='r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader, None)
+        return [reader.line_num for row in reader if row]
+
+def validate_model_csv(csv_file_path: str, icon_index: Optional[frozenset]) -> List[str]:
+    required_cols = ['Kind Name', 'Icon Name', 'Color']
+    try:
+        if _HAS_PANDAS_SUPPORT:
+            df = pd.read_csv(csv_file_path, dtype=str, keep_default_na=False)
+            df.columns = [col.strip() for col in df.columns]
+            missing_cols = [col for col in required_cols if col not in df.columns]
+            if missing_cols:
+                return [f"{csv_file_path}: CSV missing required columns: {missing_cols}"]
+            # create strips CSV values when building the model, so validate the stripped values
+            for col in required_cols:
+                df[col] = df[col].str.strip()
+            df['Icon Type'] = _ICON_TYPE
+            # blank lines and quoted newlines mean a row position is not a line number,
+            # the line map is only built once a failing row needs a location
+            record_lines = []
+            def locate(position: int) -> str:
+                if not record_lines:
+                    record_lines.extend(read_csv_record_lines(csv_file_path))
+                return f"{csv_file_path}:{record_lines[position]}"
+            return pd_validate_custom_types_frame(df, icon_index, locate)
+        errors = []
+        seen = set()
+        with open(csv_file_path, mode='r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile)
+            reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+            missing_cols = [col for col in required_cols if col not in reader.fieldnames]
+            if missing_cols:
+                return [f"{csv_file_path}: CSV missing required columns: {missing_cols}"]
+            for row in reader:
+                row_errors = validate_custom_type_row(
+                    (row.get('Kind Name') or '').strip(),
+                    _ICON_TYPE,
+                    (row.get('Icon Name') or '').strip(),
+                    (row.get('Color') or '').strip(),
+                    icon_index,
+                    seen
+                )
+                errors.extend(f"{csv_file_path}:{reader.line_num}: {error}" for error in row_errors)
+        return errors
+    except FileNotFoundError:
+        return [f"{csv_file_path}: file not found"]
+    except Exception as e:
+        return [f"{csv_file_path}: unable to parse CSV: {e}"]
+
+def validate_model_json(file_path: str, icon_index: Optional[frozenset]) -> List[str]:
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            payload = json.load(file)
+    except FileNotFoundError:
+        return [f"{file_path}: file not found"]
+    except json.JSONDecodeError as e:
+        return [f"{file_path}:{e.lineno}:{e.colno}: malformed JSON: {e.msg}"]
+    custom_types = payload.get("custom_types") if isinstance(payload, dict) else None
+    if not isinstance(custom_types, dict):
+        return [f"{file_path}: expected an object with a 'custom_types' mapping"]
+    errors = []
+    locations = []
+    rows = []
+    for kind_name, definition in custom_types.items():
+        # escape control characters so a padded kind name cannot break the report line
+        location = f"{file_path}:custom_types.{json.dumps(kind_name)[1:-1]}"
+        icon = definition.get("icon") if isinstance(definition, dict) else None
+        if not isinstance(icon, dict):
+            errors.append(f"{location}: missing 'icon' element")
+            continue
+        locations.append(location)
+        rows.append((kind_name, str(icon.get("type") or ''), str(icon.get("name") or ''), str(icon.get("color") or '')))
+    if _HAS_PANDAS_SUPPORT and rows:
+        df = pd.DataFrame(rows, columns=['Kind Name', 'Icon Type', 'Icon Name', 'Color'])
+        errors.extend(pd_validate_custom_types_frame(df, icon_index, lambda position: locations[position]))
+    else:
+        seen = set()
+        for location, (kind_name, icon_type, icon_name, color) in zip(locations, rows):
+            row_errors = validate_custom_type_row(kind_name, icon_type, icon_name, color, icon_index, seen)
+            errors.extend(f"{location}: {error}" for error in row_errors)
+    return errors
+
+def check_cypher_brackets(query: str) -> Optional[str]:
+    pairs = {')': '(', ']': '[', '}': '{'}
+    stack = []
+    quote = None
+    i = 0
+    while i < len(query):
+        char = query[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char == '/' and query.startswith('//', i):
+            # skip line comments, they may contain unbalanced quotes
+            newline = query.find('\n', i)
+            i = len(query) if newline == -1 else newline
+        elif char == '/' and query.startswith('/*', i):
+            # skip block comments the same way
+            comment_end = query.find('*/', i + 2)
+            if comment_end == -1:
+                return "unterminated block comment"
+            i = comment_end + 1
+        elif char in "'\"`":
+            quote = char
+        elif char in '([{':
+            stack.append(char)
+        elif char in pairs:
+            if not stack or stack.pop() != pairs[char]:
+                return f"unexpected '{char}' at offset {i}"
+        i += 1
+    if quote:
+        return f"unterminated string literal ({quote})"
+    if stack:
+        return f"unclosed '{stack[-1]}'"
+    return None
+
+def validate_cypher_payload(payload: Any, location: str) -> List[str]:
+    if not isinstance(payload, dict):
+        return [f"{location}: expected a JSON object with 'name' and 'query'"]
+    errors = []
+    for field in ("name", "query"):
+        value = payload.get(field)
+        if not isinstance(value, str) or not value.strip():
+            errors.append(f"{location}: missing or empty '{field}'")
+    description = payload.get("description")
+    if description is not None and not isinstance(description, str):
+        errors.append(f"{location}: 'description' must be a string")
+    query = payload.get("query")
+    if isinstance(query, str) and query.strip():
+        bracket_error = check_cypher_brackets(query)
+        if bracket_error:
+            errors.append(f"{location}: malformed query, {bracket_error}")
+    return errors
+
+def validate_cypher_file(file_path: str) -> List[str]:
+    errors = []
+    try:
+        if file_path.lower().endswith(".zip"):
+            with zipfile.ZipFile(file_path) as archive:
+                for member in archive.infolist():
+                    if member.is_dir():
+                        continue
+                    location = f"{file_path}:{member.filename}"
+                    if not member.filename.lower().endswith(".json"):
+                        errors.append(f"{location}: archive entry is not a JSON file")
+                        continue
+                    try:
+                        payload = json.loads(archive.read(member))
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        errors.append(f"{location}: malformed JSON: {e}")
+                        continue
+                    errors.extend(validate_cypher_payload(payload, location))
+        else:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                payload = json.load(file)
+            errors.extend(validate_cypher_payload(payload, file_path))
+    except FileNotFoundError:
+        errors.append(f"{file_path}: file not found")
+    except zipfile.BadZipFile as e:
+        errors.append(f"{file_path}: invalid ZIP archive: {e}")
+    except json.JSONDecodeError as e:
+        errors.append(f"{file_path}:{e.lineno}:{e.colno}: malformed JSON: {e.msg}")
+    return errors
+
+def validate_files(type: str, file_paths: List[str], icon_index: Optional[frozenset] = None) -> List[str]:
+    errors = []
+    for file_path in file_paths:
+        logging.info(f"Validating '{type}' file: {file_path}...")
+        if type == "node":
+            if file_path.lower().endswith(".csv"):
+                file_errors = validate_model_csv(file_path, icon_index)
+            else:
+                file_errors = validate_model_json(file_path, icon_index)
+        else:
+            file_errors = validate_cypher_file(file_path)
+        for error in file_errors:
+            logging.error(error)
+        errors.extend(file_errors)
+    return errors
+
 # node management methods
 def get_custom_type(base_url: str, kind_name: str) -> Optional[Dict[str, Any]]:
     logging.info(f"Listing custom type for kind_name '{kind_name}'...")
@@ -259,31 +578,36 @@ def export_custom_type(base_url: str, kind: str, output_file: str) -> Optional[D
         logging.exception(f"Failed to fetch custom node type for kind_name '{output_file}' with message: {e}")
         return False
 
+def build_custom_types_payload(items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    custom_types_data = {}
+    for item in items:
+        kind_name = item.get("kindName")
+        logging.info(f"kindName found: {kind_name}.")
+        if not kind_name:
+            logging.error("Retrieved data is missing 'kindName'. Cannot format for export.")
+            return None
+        config = item.get("config")
+        if not config:
+            logging.error("Retrieved data is missing 'config' element. Cannot format for export.")
+            return None
+        if not 'icon' in config:                
+            logging.error("Retrieved data is missing 'icon' element. Cannot format for export.")
+            return None
+        custom_types_data[kind_name] = { 
+            "icon": config.get("icon")
+        }
+    return {
+        "custom_types": custom_types_data
+    }
+
 def export_custom_types_all(base_url: str, output_file: str) -> Optional[Dict[str, Any]]:
     logging.info(f"Exporting all custom types...")
-    custom_types_data = {}
     custom_type_list = list_custom_types(base_url)
     data = custom_type_list.get("data") if custom_type_list else None
     if data:
-        for item in data:
-            kind_name = item.get("kindName")
-            logging.info(f"kindName found: {kind_name}.")
-            if not kind_name:
-                logging.error("Retrieved data is missing 'kindName'. Cannot format for export.")
-                return False
-            config = item.get("config")
-            if not config:
-                logging.error("Retrieved data is missing 'config' element. Cannot format for export.")
-                return False
-            if not 'icon' in config:                
-                logging.error("Retrieved data is missing 'icon' element. Cannot format for export.")
-                return False
-            custom_types_data[kind_name] = { 
-                "icon": config.get("icon")
-            }
-        final_payload = {
-            "custom_types": custom_types_data
-        }
+        final_payload = build_custom_types_payload(data)
+        if not final_payload:
+            return False
         output_result = write_json_to_file(final_payload, output_file, 4)
         if not output_result:
             logging.error(f"Failed to write '{type}' data to file '{output_file}'.")
@@ -467,6 +791,215 @@ def delete_all_cypher_queries(base_url: str, scope: str) -> None:
         logging.info("No custom types found.")
         return False
 
+# batch lookup methods
+def index_listing(listing: Optional[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
+    data = listing.get("data") if listing else None
+    return {str(item.get(key)): item for item in data or [] if item.get(key) is not None}
+
+def resolve_from_index(keys: List[str], index: Dict[str, Dict[str, Any]], fetch: Callable[[str], Any], workers: int = 4) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    found = {key: index[key] for key in keys if key in index}
+    missing = [key for key in keys if key not in found]
+    if missing:
+        # only entries absent from the listing cost an individual request
+        logging.info(f"{len(missing)} of {len(keys)} entries not found in the listing, fetching individually...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for key, result in zip(missing, executor.map(fetch, missing)):
+                if result and isinstance(result.get('data'), dict):
+                    found[key] = result['data']
+    not_found = [key for key in keys if key not in found]
+    return {key: found[key] for key in keys if key in found}, not_found
+
+def get_custom_types_batch(base_url: str, kind_names: List[str], workers: int = 4) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    logging.info(f"Retrieving {len(kind_names)} custom types...")
+    index = index_listing(list_custom_types(base_url), "kindName")
+    return resolve_from_index(kind_names, index, lambda kind_name: get_custom_type(base_url, kind_name), workers)
+
+def get_cypher_queries_batch(base_url: str, ids: List[str], scope: str = "owned", workers: int = 4) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    logging.info(f"Retrieving {len(ids)} cypher queries...")
+    index = index_listing(list_cypher_queries(base_url, scope), "id")
+    return resolve_from_index(ids, index, lambda id: get_cypher_query(base_url, id), workers)
+
+def export_custom_types_batch(base_url: str, kind_names: List[str], output_file: str, workers: int = 4) -> bool:
+    found, not_found = get_custom_types_batch(base_url, kind_names, workers)
+    for kind_name in not_found:
+        logging.error(f"No custom node type found with kind_name '{kind_name}'.")
+    # an export is all or nothing, a partial model is never written
+    if not found or not_found:
+        return False
+    final_payload = build_custom_types_payload(list(found.values()))
+    if not final_payload:
+        return False
+    return write_json_to_file(final_payload, output_file, 4)
+
+def export_cypher_queries_batch(base_url: str, ids: List[str], scope: str, output_file: str, workers: int = 4) -> bool:
+    if not output_file.lower().endswith(".zip"):
+        logging.error(f"File '{output_file}' does not appear to be a ZIP. Multiple cypher queries are exported as JSON files within a ZIP.")
+        return False
+    found, not_found = get_cypher_queries_batch(base_url, ids, scope, workers)
+    for id in not_found:
+        logging.error(f"No cypher query found with id '{id}'.")
+    # an export is all or nothing, a partial archive is never written
+    if not found or not_found:
+        return False
+    # keep the same fields as the single query export so the archive can be uploaded again
+    queries = [{field: item.get(field) for field in ("name", "description", "query")} for item in found.values()]
+    count = write_cypher_queries_zip(iter(queries), output_file)[0]
+    return count > 0
+
+# cypher generation methods
+def render_cypher_template(value: Any, params: Dict[str, str]) -> Any:
+    # substitute {{column}} placeholders in every string of the template, '$' is left alone for cypher parameters
+    if isinstance(value, str):
+        return _PLACEHOLDER_RE.sub(lambda match: params[match.group(1)], value)
+    if isinstance(value, dict):
+        return {key: render_cypher_template(item, params) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render_cypher_template(item, params) for item in value]
+    return value
+
+def find_template_placeholders(value: Any) -> set:
+    if isinstance(value, str):
+        return set(_PLACEHOLDER_RE.findall(value))
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return set().union(*(find_template_placeholders(item) for item in value))
+    return set()
+
+def check_template_columns(source: str, placeholders: set, columns: Iterable[str]) -> None:
+    # fail once up front instead of once per row
+    missing = sorted(placeholders - set(columns))
+    if missing:
+        raise ValueError(f"'{source}' has no column for template placeholder(s): {missing}")
+
+def read_template_params_csv(csv_file_path: str, placeholders: set) -> Iterator[Tuple[str, Dict[str, str]]]:
+    # rows are streamed with the csv module so memory stays flat regardless of the parameter file size
+    with open(csv_file_path, mode='rb') as csvfile:
+        # decode line by line so an encoding error can be reported with its line number
+        reader = csv.DictReader(line.decode('utf-8') for line in csvfile)
+        try:
+            reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+            check_template_columns(csv_file_path, placeholders, reader.fieldnames)
+            for row in reader:
+                yield f"{csv_file_path}:{reader.line_num}", {key: (value or '').strip() for key, value in row.items() if key}
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"{csv_file_path}:{reader.line_num + 1}: {e}") from e
+
+def read_template_params_model(model_file_path: str, placeholders: set) -> Iterator[Tuple[str, Dict[str, str]]]:
+    # expose each kind with the same column names used by the model CSV
+    check_template_columns(model_file_path, placeholders, _MODEL_TEMPLATE_COLUMNS)
+    with open(model_file_path, 'r', encoding='utf-8') as file:
+        payload = json.load(file)
+    custom_types = payload.get("custom_types") if isinstance(payload, dict) else None
+    if not isinstance(custom_types, dict):
+        raise ValueError(f"'{model_file_path}' does not contain a 'custom_types' mapping")
+    for kind_name, definition in custom_types.items():
+        icon = definition.get("icon", {}) if isinstance(definition, dict) else {}
+        yield f"{model_file_path}:custom_types.{kind_name}", dict(zip(_MODEL_TEMPLATE_COLUMNS, (
+            kind_name,
+            str(icon.get("name") or ''),
+            str(icon.get("color") or '')
+        )))
+
+def generate_cypher_queries(template: Dict[str, Any], params_iter: Iterator[Tuple[str, Dict[str, str]]]) -> Iterator[Dict[str, Any]]:
+    for location, params in params_iter:
+        try:
+            payload = render_cypher_template(template, params)
+        except KeyError as e:
+            logging.error(f"{location}: no value for template placeholder {e}, skipping.")
+            continue
+        errors = validate_cypher_payload(payload, location)
+        if errors:
+            for error in errors:
+                logging.error(f"{error}, skipping.")
+            continue
+        yield payload
+
+def write_cypher_queries_zip(queries: Iterator[Dict[str, Any]], output_file: str, max_zip_bytes: Optional[int] = None) -> Tuple[int, List[str]]:
+    # roll over to output-2.zip, output-3.zip... once an archive would grow past max_zip_bytes
+    root, ext = os.path.splitext(output_file)
+    archives = []
+    archive = None
+    directory_bytes = 0
+    count = 0
+    try:
+        for query in queries:
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', query.get("name", ""))[:100]
+            entry_name = f"{count + 1:06d}-{safe_name}.json"
+            entry = json.dumps(query, indent=4).encode('utf-8')
+            # upper bound on what the entry adds: uncompressed data, local header and central directory record
+            entry_bytes = len(entry) + 30 + 46 + 2 * len(entry_name)
+            if archive is not None and max_zip_bytes and archive.fp.tell() + directory_bytes + entry_bytes + 22 > max_zip_bytes:
+                archive.close()
+                archive = None
+            if archive is None:
+                archive_path = output_file if not archives else f"{root}-{len(archives) + 1}{ext}"
+                logging.info(f"Saving cypher archive as: '{archive_path}'")
+                archive = zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED)
+                archives.append(archive_path)
+                directory_bytes = 0
+            count += 1
+            archive.writestr(entry_name, entry)
+            directory_bytes += 46 + len(entry_name)
+    except Exception:
+        # do not leave incomplete archives behind
+        if archive is not None:
+            archive.close()
+            archive = None
+        for archive_path in archives:
+            os.remove(archive_path)
+            logging.warning(f"Removed incomplete cypher archive '{archive_path}'.")
+        raise
+    finally:
+        if archive is not None:
+            archive.close()
+    return count, archives
+
+def import_cypher_payload(base_url: str, payload: Dict[str, Any]) -> bool:
+    url = f"{base_url}{saved_queries_path}/import"
+    try:
+        response = handle_request('POST', url, json=payload)
+        return bool(response[0])
+    except requests.exceptions.RequestException as e:
+        logging.exception(f"API request failed for query '{payload.get('name')}': {e}")
+        return False
+
+def upload_cypher_queries_parallel(base_url: str, queries: Iterator[Dict[str, Any]], workers: int = 4) -> Tuple[int, int]:
+    # prompt before starting the workers so the JWT is only requested once
+    prompt_for_jwt()
+    succeeded = 0
+    failed = 0
+    pending = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for query in queries:
+            # cap the number of queued uploads so generation never runs far ahead of the network
+            if len(pending) >= workers * 2:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future.result():
+                        succeeded += 1
+                    else:
+                        failed += 1
+            pending.add(executor.submit(import_cypher_payload, base_url, query))
+        for future in concurrent.futures.as_completed(pending):
+            if future.result():
+                succeeded += 1
+            else:
+                failed += 1
+    return succeeded, failed
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'")
+    return number
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
 # ---------------------------------------------------------
 # Main Entry Point
 # ---------------------------------------------------------
@@ -476,17 +1009,26 @@ def main() -> None:
     subparsers = parser.add_subparsers(dest="operation", required=True)
 
     # Subcommand: create
-    get_parser = subparsers.add_parser("create", help="Create a schema model from CSV definitions.")
-    get_parser.add_argument("--type", choices=["model"], help="Type of resource to create.", required=True)
-    get_parser.add_argument("--csv", help="CSV file that contains model definitions.", required=True)
-    get_parser.add_argument("--file", help="Output file to write the model to.", required=True)
+    get_parser = subparsers.add_parser("create", help="Create a schema model from CSV definitions, or cypher queries from a template.")
+    get_parser.add_argument("--type", choices=["model", "cypher"], help="Type of resource to create.", required=True)
+    get_parser.add_argument("--csv", help="CSV file that contains model definitions, or template parameters for cypher.")
+    get_parser.add_argument("--file", help="Output file to write the model or cypher ZIP to.")
+    get_parser.add_argument("--template", help="Cypher query JSON with {{column}} placeholders (required for cypher).")
+    get_parser.add_argument("--model", help="Model JSON whose kinds are used as template parameters for cypher.")
+    get_parser.add_argument("--max-zip-mb", type=positive_float, help="Start a new ZIP once an archive reaches this size (cypher only).")
+    get_parser.add_argument("--url", help="Upload generated cypher queries directly instead of writing a ZIP.")
+    get_parser.add_argument("--workers", type=positive_int, default=4, help="Number of concurrent uploads when '--url' is used.")
 
     # Subcommand: get
     get_parser = subparsers.add_parser("get", help="Retrieve a specific resource")
     get_parser.add_argument("--url", required=True)
     get_parser.add_argument("--type", choices=["node", "cypher"], required=True)
-    get_parser.add_argument("--id", help="ID of the resource")
-    get_parser.add_argument("--name", help="Name of the resource")
+    get_parser.add_argument("--id", nargs='+', help="ID of the resource, or several IDs")
+    get_parser.add_argument("--name", nargs='+', help="Name of the resource, or several names")
+    get_parser.add_argument("--from-file", help="File with one name or ID per line")
+    get_parser.add_argument("--scope", choices=["all", "public", "shared", "owned"], default="owned", help="Scope for cypher queries")
+    get_parser.add_argument("--file", help="Write the retrieved resources to this file as NDJSON")
+    get_parser.add_argument("--workers", type=positive_int, default=4, help="Number of concurrent GETs for entries missing from the listing")
 
     # Subcommand: list
     list_parser = subparsers.add_parser("list", help="List custom node or cypher resources")
@@ -499,14 +1041,24 @@ def main() -> None:
     upload_parser.add_argument("--url", required=True)
     upload_parser.add_argument("--type", choices=["node", "cypher"], required=True)
     upload_parser.add_argument("--file", required=True)
+    upload_parser.add_argument("--icons", help="Icon index (font-awesome icons.json or one name per line) used instead of the bundled font-awesome free icon list")
+    upload_parser.add_argument("--skip-validation", action='store_true', help="Upload without validating the file first")
+
+    # Subcommand: validate
+    validate_parser = subparsers.add_parser("validate", help="Validate model or cypher files offline")
+    validate_parser.add_argument("--type", choices=["node", "cypher"], required=True)
+    validate_parser.add_argument("--file", nargs='+', help="Model CSV/JSON files, or cypher JSON/ZIP files, to validate", required=True)
+    validate_parser.add_argument("--icons", help="Icon index (font-awesome icons.json or one name per line) used instead of the bundled font-awesome free icon list")
 
     # Subcommand: export
     export_parser = subparsers.add_parser("export", help="Export custom node or cypher resources")
     export_parser.add_argument("--url", required=True)
     export_parser.add_argument("--type", choices=["node", "cypher"], required=True)
     export_parser.add_argument("--all", action='store_true', help="Export all node or cypher resources")
-    export_parser.add_argument("--id", help="ID of the resource (required for cypher query export)")
-    export_parser.add_argument("--name", help="Kind name of the resource (required for custom type export)")
+    export_parser.add_argument("--id", nargs='+', help="ID of the resource, or several IDs (required for cypher query export)")
+    export_parser.add_argument("--name", nargs='+', help="Kind name of the resource, or several kind names (required for custom type export)")
+    export_parser.add_argument("--from-file", help="File with one kind name or ID per line")
+    export_parser.add_argument("--workers", type=positive_int, default=4, help="Number of concurrent GETs for entries missing from the listing")
     export_parser.add_argument("--scope", choices=["all", "public", "shared", "owned"], default="owned", help="Scope for cypher queries")
     export_parser.add_argument("--file", required=True)
 
@@ -530,6 +1082,9 @@ def main() -> None:
     # create methods
     if operation == "create":
         if type == "model":
+            if not args.csv or not args.file:
+                logging.error(f"Operation '{operation}' for type '{type}' requires '--csv' and '--file'.")
+                sys.exit(1)
             if _HAS_PANDAS_SUPPORT:
                 results = pd_transform_csv_to_custom_types_json(args.csv)
             else:
@@ -542,44 +1097,104 @@ def main() -> None:
                 logging.info(f"Successfully wrote model from '{args.csv}' to file '{args.file}'.")
             else:
                 logging.error(f"Failed to read model defintion from CSV file '{args.csv}'")                
+        elif type == "cypher":
+            if not args.template or bool(args.csv) == bool(args.model):
+                logging.error(f"Operation '{operation}' for type '{type}' requires '--template' and exactly one of '--csv' or '--model'.")
+                sys.exit(1)
+            if bool(args.file) == bool(args.url):
+                logging.error(f"Operation '{operation}' for type '{type}' requires exactly one of '--file' or '--url'.")
+                sys.exit(1)
+            if args.url and args.max_zip_mb:
+                logging.error("Option '--max-zip-mb' only applies to ZIP output and cannot be combined with '--url'.")
+                sys.exit(1)
+            try:
+                with open(args.template, 'r', encoding='utf-8') as file:
+                    template = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                logging.error(f"Failed to read cypher template '{args.template}': {e}")
+                sys.exit(1)
+            params_source = args.csv or args.model
+            placeholders = find_template_placeholders(template)
+            params_iter = read_template_params_csv(args.csv, placeholders) if args.csv else read_template_params_model(args.model, placeholders)
+            queries = generate_cypher_queries(template, params_iter)
+            try:
+                # generate the first query up front so a bad parameter file fails before any JWT prompt
+                first_query = next(queries, None)
+            except (FileNotFoundError, json.JSONDecodeError, ValueError, csv.Error) as e:
+                logging.error(f"Failed to read template parameters from '{params_source}': {e}")
+                sys.exit(1)
+            if first_query is None:
+                logging.error(f"No cypher queries were generated from '{params_source}'.")
+                sys.exit(1)
+            queries = itertools.chain([first_query], queries)
+            if args.url:
+                try:
+                    succeeded, failed = upload_cypher_queries_parallel(args.url, queries, args.workers)
+                except ValueError as e:
+                    logging.error(f"Failed to read template parameters, stopped uploading: {e}")
+                    logging.error("Queries generated before this error may already have been uploaded.")
+                    sys.exit(1)
+                logging.info(f"Uploaded {succeeded} cypher queries generated from '{params_source}', {failed} failed.")
+                if failed or not succeeded:
+                    logging.error(f"Failed to upload cypher queries generated from '{params_source}'.")
+                    sys.exit(1)
+            else:
+                max_zip_bytes = int(args.max_zip_mb * 1024 * 1024) if args.max_zip_mb else None
+                try:
+                    count, archives = write_cypher_queries_zip(queries, args.file, max_zip_bytes)
+                except ValueError as e:
+                    logging.error(f"Failed to read template parameters, no archive written: {e}")
+                    sys.exit(1)
+                logging.info(f"Successfully wrote {count} cypher queries generated from '{params_source}' to {len(archives)} archive(s).")
         else:
             logging.error(f"No methods defined for operation '{operation}' and type {type}")
 
     # get methods
     if operation == "get":
         base_url = args.url
+        try:
+            keys = read_batch_keys(args.name if type == "node" else args.id, args.from_file)
+        except FileNotFoundError:
+            logging.error(f"File not found at path '{args.from_file}'")
+            sys.exit(1)
         if type == "node":
-            # name argument is required for the cypher type
-            if args.name:                
-                results = get_custom_type(base_url, args.name)
-                if results and 'data' in results:        
-                    parsed_results = results
-                    if isinstance(parsed_results['data'], dict):
-                        item = parsed_results['data']
-                        #logging.info(f"ID: {item.get('id')}, Name: {item.get('kindName')}")
-                        item_config = item.get('config')
-                        if 'icon' in item_config:
-                            icon_config = item_config.get('icon')
-                            logging.info(f"ID: {item.get('id')}, Name: {item.get('kindName')}, type: {icon_config.get('type')}, Name: {icon_config.get('name')}, Color: {icon_config.get('color')}")
-                    else:
-                        logging.warning(f"Unexpected data type in response: {type(parsed_results['data'])}")
+            # name argument is required for the node type
+            if keys:
+                # a single name is one GET, several names are resolved from one listing
+                if len(keys) == 1 and not args.file:
+                    results = get_custom_type(base_url, keys[0])
+                    found = {keys[0]: results['data']} if results and isinstance(results.get('data'), dict) else {}
+                    not_found = [key for key in keys if key not in found]
                 else:
-                    logging.info(f"No custom node types found with kind_name: {args.name}.")
+                    found, not_found = get_custom_types_batch(base_url, keys, args.workers)
+                for item in found.values():
+                    item_config = item.get('config') or {}
+                    if 'icon' in item_config:
+                        icon_config = item_config.get('icon')
+                        logging.info(f"ID: {item.get('id')}, Name: {item.get('kindName')}, type: {icon_config.get('type')}, Name: {icon_config.get('name')}, Color: {icon_config.get('color')}")
+                for kind_name in not_found:
+                    logging.info(f"No custom node types found with kind_name: {kind_name}.")
             else:
-                logging.error(f"A kind_name '--name' is required for the operation '{operation}' with type '{type}' .")
+                logging.error(f"A kind_name '--name' or '--from-file' is required for the operation '{operation}' with type '{type}' .")
         elif type == "cypher":
             # id argument is required for the cypher type
-            if args.id:
-                results = get_cypher_query(base_url, args.id)
-                if results and 'data' in results:
-                    parsed_results = results 
-                    if isinstance(parsed_results['data'], dict):
-                        item = parsed_results['data']
-                        logging.info(f"ID: {item.get('id')}, Name: {item.get('name')}, Created_At: {item.get('created_at')}, Updated_At: {item.get('updated_at')}, User_id: {item.get('user_id')}, Description: {item.get('description')}, Query: {repr(item.get('query'))}")
+            if keys:
+                if len(keys) == 1 and not args.file:
+                    results = get_cypher_query(base_url, keys[0])
+                    found = {keys[0]: results['data']} if results and isinstance(results.get('data'), dict) else {}
+                    not_found = [key for key in keys if key not in found]
                 else:
-                    logging.info(f"No cypher queries found with id: {args.id}.")
+                    found, not_found = get_cypher_queries_batch(base_url, keys, args.scope, args.workers)
+                for item in found.values():
+                    logging.info(f"ID: {item.get('id')}, Name: {item.get('name')}, Created_At: {item.get('created_at')}, Updated_At: {item.get('updated_at')}, User_id: {item.get('user_id')}, Description: {item.get('description')}, Query: {repr(item.get('query'))}")
+                for id in not_found:
+                    logging.info(f"No cypher queries found with id: {id}.")
             else:
-                logging.error(f"A cypher '--id' is required for the operation '{operation}' with type '{type}' .")                       
+                logging.error(f"A cypher '--id' or '--from-file' is required for the operation '{operation}' with type '{type}' .")                       
+        if keys and args.file:
+            if not write_ndjson_to_file(list(found.values()), args.file):
+                sys.exit(1)
+            logging.info(f"Successfully wrote {len(found)} '{type}' entries to file '{args.file}'.")
           
     # list methods
     elif operation == "list":
@@ -606,6 +1221,17 @@ def main() -> None:
     # upload methods
     elif operation == "upload":
         base_url = args.url
+        # validate offline first so bad rows never cost an upload round trip
+        if not args.skip_validation:
+            icon_index = None
+            if type == "node":
+                icon_index = load_icon_index(args.icons or _DEFAULT_ICON_INDEX)
+                if icon_index is None:
+                    sys.exit(1)
+            validation_errors = validate_files(type, [args.file], icon_index)
+            if validation_errors:
+                logging.error(f"Validation found {len(validation_errors)} error(s) in file {args.file}, upload aborted. Use '--skip-validation' to upload anyway.")
+                sys.exit(1)
         if type == "node":
             if not args.file:
                 logging.error(f"Operation '{operation}' requires a '--file' parameter.")
@@ -624,29 +1250,51 @@ def main() -> None:
         else:
             logging.error(f"Operation '{operation}' for type '{type}' with file {args.file} failed.")
 
+    # validate methods
+    elif operation == "validate":
+        icon_index = None
+        if type == "node":
+            icon_index = load_icon_index(args.icons or _DEFAULT_ICON_INDEX)
+            if icon_index is None:
+                sys.exit(1)
+        validation_errors = validate_files(type, args.file, icon_index)
+        if validation_errors:
+            logging.error(f"Validation failed with {len(validation_errors)} error(s) across {len(args.file)} file(s).")
+            sys.exit(1)
+        logging.info(f"Validation passed for {len(args.file)} file(s).")
+
     # export methods
     elif operation == "export":
         base_url = args.url
+        try:
+            keys = read_batch_keys(args.name if type == "node" else args.id, args.from_file)
+        except FileNotFoundError:
+            logging.error(f"File not found at path '{args.from_file}'")
+            sys.exit(1)
         if type == "node":
-            if not args.name and not args.all:
-                logging.error(f"Operation '{operation}' for type '{type}' requires either '--name' or '--all'.")
+            if not keys and not args.all:
+                logging.error(f"Operation '{operation}' for type '{type}' requires either '--name', '--from-file' or '--all'.")
                 sys.exit(1)
             if args.all:
                 output_result = export_custom_types_all(base_url=base_url, output_file=args.file)                
+            elif len(keys) == 1:
+                output_result = export_custom_type(base_url=base_url, kind=keys[0], output_file=args.file)                
             else:
-                output_result = export_custom_type(base_url=base_url, kind=args.name, output_file=args.file)                
+                output_result = export_custom_types_batch(base_url, keys, args.file, args.workers)
             if not output_result:
                 logging.error(f"Failed to export '{type}' data to file '{args.file}'.")
                 sys.exit(1)
             logging.info(f"Successfully exported '{type}' data to file '{args.file}'.")                     
         elif type == "cypher":
-            if not args.id and not args.all:
-                logging.error(f"Operation '{operation}' for type '{type}' requires either '--id' or '--all'.")
+            if not keys and not args.all:
+                logging.error(f"Operation '{operation}' for type '{type}' requires either '--id', '--from-file' or '--all'.")
                 sys.exit(1)
             if args.all:
                 output_result = export_cypher_queries(base_url, args.scope, args.file)
+            elif len(keys) == 1:
+                output_result = export_cypher_query(base_url, keys[0], args.file)
             else:
-                output_result = export_cypher_query(base_url, args.id, args.file)
+                output_result = export_cypher_queries_batch(base_url, keys, args.scope, args.file, args.workers)
             if not output_result:
                 logging.error(f"Failed to export '{type}' data to file '{args.file}'.")
                 sys.exit(1)
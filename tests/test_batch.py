@@ -0,0 +1,63 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import houndtrainer
+
+BASE_URL = "http://bloodhound.local"
+NODES_URL = f"{BASE_URL}{houndtrainer.custom_nodes_path}"
+LISTING = [
+    {"id": 1, "kindName": "ExampleUser", "config": {"icon": {"type": "font-awesome", "name": "user", "color": "#4D93D9"}}},
+    {"id": 2, "kindName": "ExampleRole", "config": {"icon": {"type": "font-awesome", "name": "user-group", "color": "#47D359"}}},
+]
+HIDDEN = {"id": 3, "kindName": "ExampleHidden", "config": {"icon": {"type": "font-awesome", "name": "house", "color": "#000000"}}}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return {"data": self.data}
+
+
+def stub_requests(monkeypatch):
+    requested = []
+
+    def handle_request(method, url, **kwargs):
+        requested.append(url)
+        if url == NODES_URL:
+            return True, FakeResponse(LISTING)
+        if url == f"{NODES_URL}/ExampleHidden":
+            return True, FakeResponse(HIDDEN)
+        return False, None
+
+    monkeypatch.setattr(houndtrainer, "handle_request", handle_request)
+    return requested
+
+
+def test_batch_resolves_listing_hits_fallbacks_and_misses(monkeypatch):
+    requested = stub_requests(monkeypatch)
+    found, not_found = houndtrainer.get_custom_types_batch(
+        BASE_URL, ["ExampleRole", "ExampleHidden", "Missing", "ExampleUser"]
+    )
+    # requested order is kept, listing hits need no individual GET
+    assert list(found) == ["ExampleRole", "ExampleHidden", "ExampleUser"]
+    assert found["ExampleHidden"] == HIDDEN
+    assert not_found == ["Missing"]
+    assert requested[0] == NODES_URL
+    assert sorted(requested[1:]) == [f"{NODES_URL}/ExampleHidden", f"{NODES_URL}/Missing"]
+
+
+def test_batch_export_writes_combined_model(monkeypatch, tmp_path):
+    stub_requests(monkeypatch)
+    output_file = tmp_path / "model.json"
+    assert houndtrainer.export_custom_types_batch(BASE_URL, ["ExampleUser", "ExampleHidden"], str(output_file))
+    assert output_file.read_text().count('"icon"') == 2
+
+
+def test_batch_export_writes_nothing_when_a_name_is_missing(monkeypatch, tmp_path):
+    stub_requests(monkeypatch)
+    output_file = tmp_path / "model.json"
+    assert not houndtrainer.export_custom_types_batch(BASE_URL, ["ExampleUser", "Missing"], str(output_file))
+    assert not output_file.exists()
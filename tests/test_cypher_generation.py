@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import houndtrainer
+
+TEMPLATE = {
+    "query": "match(a:{{Kind Name}})\nwhere a.objectid = $objectid\nreturn a",
+    "name": "Find {{ Kind Name }}",
+    "description": "Find {{Kind Name}} nodes",
+}
+
+
+def test_render_cypher_template():
+    payload = houndtrainer.render_cypher_template(TEMPLATE, {"Kind Name": "ExampleUser"})
+    assert payload == {
+        "query": "match(a:ExampleUser)\nwhere a.objectid = $objectid\nreturn a",
+        "name": "Find ExampleUser",
+        "description": "Find ExampleUser nodes",
+    }
+    assert houndtrainer.find_template_placeholders(TEMPLATE) == {"Kind Name"}
+    with pytest.raises(KeyError):
+        houndtrainer.render_cypher_template(TEMPLATE, {"Icon Name": "user"})
+
+
+def test_write_cypher_queries_zip_rolls_over_at_bound(tmp_path):
+    queries = ({"name": f"Query {i}", "query": f"match (n:Kind{i}) return n"} for i in range(2000))
+    output_file = str(tmp_path / "queries.zip")
+    max_zip_bytes = 64 * 1024
+    count, archives = houndtrainer.write_cypher_queries_zip(queries, output_file, max_zip_bytes)
+    assert count == 2000
+    assert len(archives) > 1
+    assert archives[0] == output_file
+    assert archives[1] == str(tmp_path / "queries-2.zip")
+    entries = []
+    for archive_path in archives:
+        assert os.path.getsize(archive_path) <= max_zip_bytes
+        with zipfile.ZipFile(archive_path) as archive:
+            entries.extend(json.loads(archive.read(name))["name"] for name in archive.namelist())
+    assert entries == [f"Query {i}" for i in range(2000)]
+
+
+def test_write_cypher_queries_zip_removes_partial_archives(tmp_path):
+    def queries():
+        yield {"name": "Query", "query": "match (n) return n"}
+        raise ValueError("params.csv:3: bad row")
+
+    output_file = tmp_path / "queries.zip"
+    with pytest.raises(ValueError):
+        houndtrainer.write_cypher_queries_zip(queries(), str(output_file))
+    assert not output_file.exists()
+
+
+def test_read_template_params_csv_checks_columns_once(tmp_path):
+    path = tmp_path / "params.csv"
+    path.write_text("Kind Name\nExampleUser\n\nExampleRole\n")
+    rows = list(houndtrainer.read_template_params_csv(str(path), {"Kind Name"}))
+    assert rows == [(f"{path}:2", {"Kind Name": "ExampleUser"}), (f"{path}:4", {"Kind Name": "ExampleRole"})]
+    with pytest.raises(ValueError, match="Icon Name"):
+        next(houndtrainer.read_template_params_csv(str(path), {"Kind Name", "Icon Name"}))
@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import houndtrainer
+
+pytest.importorskip("pandas")
+
+ICON_INDEX = frozenset(["user", "user-group"])
+
+
+def validate_both_ways(monkeypatch, validate, path):
+    monkeypatch.setattr(houndtrainer, "_HAS_PANDAS_SUPPORT", True)
+    with_pandas = validate(str(path), ICON_INDEX)
+    monkeypatch.setattr(houndtrainer, "_HAS_PANDAS_SUPPORT", False)
+    without_pandas = validate(str(path), ICON_INDEX)
+    return with_pandas, without_pandas
+
+
+def test_model_json_parity_with_padded_values(tmp_path, monkeypatch):
+    model = {
+        "custom_types": {
+            "ExampleUser": {"icon": {"type": "font-awesome", "name": "user", "color": "#4D93D9"}},
+            "Padded": {"icon": {"type": "font-awesome", "name": " user", "color": "#fff\n"}},
+            "Tail\n": {"icon": {"type": "font-awesome", "name": "usr", "color": "#fff"}},
+        }
+    }
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps(model))
+    with_pandas, without_pandas = validate_both_ways(monkeypatch, houndtrainer.validate_model_json, path)
+    assert with_pandas == without_pandas
+    assert len(with_pandas) == 4
+
+
+def test_model_csv_parity(tmp_path, monkeypatch):
+    path = tmp_path / "model.csv"
+    path.write_text(
+        "Kind Name,Icon Name,Color\n"
+        "ExampleUser, user ,#4D93D9\n"
+        "Bad Kind,User!,4D93D9\n"
+        "ExampleUser,,#GGGGGG\n"
+    )
+    with_pandas, without_pandas = validate_both_ways(monkeypatch, houndtrainer.validate_model_csv, path)
+    assert with_pandas == without_pandas
+    assert len(with_pandas) == 6
+
+
+def test_model_csv_reports_file_lines(tmp_path, monkeypatch):
+    path = tmp_path / "model.csv"
+    path.write_text(
+        "Kind Name,Icon Name,Color\n"
+        "ExampleUser,user,#4D93D9\n"
+        "\n"
+        "Bad Kind,user,#4D93D9\n"
+        "ExampleRole,usr,#47D359\n"
+    )
+    with_pandas, without_pandas = validate_both_ways(monkeypatch, houndtrainer.validate_model_csv, path)
+    assert with_pandas == without_pandas
+    assert [error.split(": ")[0] for error in with_pandas] == [f"{path}:4", f"{path}:5"]
+
+
+def test_default_icon_index_includes_aliases():
+    icon_index = houndtrainer.load_icon_index(houndtrainer._DEFAULT_ICON_INDEX)
+    assert {"house", "home", "magnifying-glass", "search", "users-gear", "users-cog"} <= icon_index
+    assert "usr" not in icon_index
+
+
+def test_cypher_comments_are_skipped():
+    assert houndtrainer.check_cypher_brackets("match (n) /* don't */ return n") is None
+    assert houndtrainer.check_cypher_brackets("match (n) // don't\nreturn n") is None
+    assert houndtrainer.check_cypher_brackets("match (n /* ) */ return n") == "unclosed '('"